@@ -0,0 +1,73 @@
+import hashlib
+import sqlite3
+import threading
+import time
+from datetime import timedelta
+
+class ArticleCache:
+    """
+    Small SQLite store for parsed article content, keyed by the SHA1 digest of the article URL.
+    Lets re-runs skip fetching and cleaning articles that were already scraped.
+    """
+    def __init__(self, db_path, ttl=timedelta(days=7)):
+        self.ttl_seconds = ttl.total_seconds()
+        # The scraper reads and writes from its worker threads, so one connection is shared behind a lock
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS articles("
+            "url_hash BLOB PRIMARY KEY, fetched_at INTEGER, content TEXT, published TEXT)"
+        )
+        # Databases created before publish date tracking lack that column
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(articles)")}
+        if 'published' not in columns:
+            self.conn.execute("ALTER TABLE articles ADD COLUMN published TEXT")
+
+    @staticmethod
+    def _key(url):
+        return hashlib.sha1(url.encode('utf-8')).digest()
+
+    def get(self, url):
+        """
+        Returns the cached content for `url`, or None if it is missing or older than the TTL.
+        """
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT fetched_at, content FROM articles WHERE url_hash=?", (self._key(url),)
+            ).fetchone()
+        if row and time.time() - row[0] < self.ttl_seconds:
+            return row[1]
+        return None
+
+    def get_entry(self, url):
+        """
+        Returns (content, published) for `url`, or None if it is missing or older than the TTL.
+        Used for sources whose article page also supplies the publish date.
+        """
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT fetched_at, content, published FROM articles WHERE url_hash=?", (self._key(url),)
+            ).fetchone()
+        if row and time.time() - row[0] < self.ttl_seconds:
+            return row[1], row[2]
+        return None
+
+    def put(self, url, content, published=None):
+        """
+        Stores the parsed content for `url` along with the article's publish date, if any.
+        Writes are only persisted on `commit()`.
+        """
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO articles(url_hash, fetched_at, content, published) VALUES (?, ?, ?, ?)",
+                (self._key(url), int(time.time()), content, published)
+            )
+
+    def commit(self):
+        with self._lock:
+            self.conn.commit()
+
+    def close(self):
+        with self._lock:
+            self.conn.commit()
+            self.conn.close()
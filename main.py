@@ -1,29 +1,36 @@
 import argparse
-from news_scraper import NepseNewsScraper
-from sentiment_analyzer import SentimentAnalyzer
-import json
+import os
 
-def main():
+def build_parser():
     parser = argparse.ArgumentParser(description="NEPSE Stock News Sentiment Analysis")
     subparsers = parser.add_subparsers(dest='command', required=True)
     
     # Scrape command
-    scrape_parser = subparsers.add_parser('scrape', help='Scrape news for a NEPSE stock symbol')
-    scrape_parser.add_argument('symbol', type=str, help='NEPSE stock symbol to scrape news for')
+    scrape_parser = subparsers.add_parser('scrape', help='Scrape news for one or more NEPSE stock symbols')
+    scrape_parser.add_argument('symbols', metavar='symbol', type=str, nargs='+', help='NEPSE stock symbol(s) to scrape news for')
+    scrape_parser.add_argument('--force-refresh', action='store_true', help='Ignore cached pages and previously scraped articles')
     
     # Analyze command
     analyze_parser = subparsers.add_parser('analyze', help='Analyze sentiment of scraped news')
     analyze_parser.add_argument('symbol', type=str, help='NEPSE stock symbol to analyze')
     analyze_parser.add_argument('--report', action='store_true', help='Generate a detailed report')
     
-    args = parser.parse_args()
-    
+    return parser
+
+def run(args):
+    # The scraper (Selenium) and the analyzer (Ollama client) are imported lazily so that
+    # `--help` and each subcommand only pay for the modules they actually use
     if args.command == 'scrape':
-        scraper = NepseNewsScraper()
-        count = scraper.scrape_news(args.symbol)
-        print(f"Scraped {count} news items for {args.symbol.upper()}")
+        from news_scraper import NepseNewsScraper
+
+        with NepseNewsScraper() as scraper:
+            results = scraper.scrape_symbols(args.symbols, force_refresh=args.force_refresh)
+        for symbol, news_items in results.items():
+            print(f"Scraped {len(news_items)} news items for {symbol.upper()}")
     
     elif args.command == 'analyze':
+        from sentiment_analyzer import SentimentAnalyzer
+
         analyzer = SentimentAnalyzer()
         analyzed_news = analyzer.analyze_news_for_symbol(args.symbol)
         
@@ -31,9 +38,12 @@ def main():
             report = analyzer.generate_report(args.symbol, analyzed_news)
             print(report)
             
-            # Save report to file
-            with open(f"{args.symbol.lower()}_sentiment_report.txt", 'w', encoding='utf-8') as f:
+            # Save report to file (write to a temp file and rename so a crash never leaves a partial report)
+            report_filename = f"{args.symbol.lower()}_sentiment_report.txt"
+            tmp_filename = report_filename + '.tmp'
+            with open(tmp_filename, 'w', encoding='utf-8', buffering=1 << 20) as f:
                 f.write(report)
+            os.replace(tmp_filename, report_filename)
         else:
             # Just show the sentiment table for each news item
             if not analyzed_news:
@@ -45,5 +55,8 @@ def main():
                 print(item['sentiment_analysis'])
                 print("-" * 40)
 
+def main():
+    run(build_parser().parse_args())
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
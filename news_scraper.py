@@ -1,16 +1,207 @@
 import requests
-from bs4 import BeautifulSoup
-import json
+import requests_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry, make_headers
+from selectolax.lexbor import LexborHTMLParser
+import orjson
 import os
-from datetime import datetime
-from urllib.parse import quote, urljoin
+import atexit
+from datetime import datetime, timedelta
+from urllib.parse import quote, urljoin, urlparse, urlsplit, urlunsplit, parse_qsl, urlencode
 import time
-import re
+import threading
+import hashlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, WebDriverException
+from article_cache import ArticleCache
+
+# Paragraphs starting with these are licensing/byline boilerplate rather than article text.
+# For three short prefixes a hoisted tuple with str.startswith beats both a regex and an Aho-Corasick automaton.
+_BOILER_PREFIXES = ('©', 'License:', 'Author:')
+
+# Elements stripped from Investopaper article bodies before collecting paragraphs
+_BAD_CHILDREN = ('div', 'script', 'style', 'aside', 'pre', 'hr')
+_BAD_CLASSES = frozenset(('sfsiaftrpstwpr', 'sfsi_responsive_icons'))
+_BAD_CHILDREN_SELECTOR = ', '.join(_BAD_CHILDREN + tuple(f'.{cls}' for cls in sorted(_BAD_CLASSES)))
+
+# Elements stripped from Sharesansar article bodies, matched in one selector pass
+_SHARESANSAR_BAD_SELECTOR = 'div, script, style, aside, figure, img'
+
+# Placeholder contents of articles whose fetch failed; such items are retried instead of reused
+_FAILED_CONTENT_PREFIXES = ('Error retrieving', 'Timeout retrieving')
+# Placeholder contents of articles without a readable body; these never count as duplicates
+_EMPTY_CONTENTS = frozenset(('Content not found', 'Full article content not found', 'No readable content found'))
+
+# Query parameters that only track where a click came from and never change the article
+_TRACKING_PARAMS = frozenset(('ref', 'fbclid'))
+
+def _canonicalize_url(url):
+    """
+    Normalizes an article URL so trivially different links to the same page compare equal.
+    The host is lowercased, tracking parameters (utm_*, ref, fbclid), the fragment and any
+    trailing slash are dropped.
+
+    Args:
+        url (str): The article URL.
+
+    Returns:
+        str: The canonical form of the URL.
+    """
+    parts = urlsplit(url)
+    query = urlencode([
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.startswith('utm_') and key not in _TRACKING_PARAMS
+    ])
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path.rstrip('/'), query, ''))
+
+# ShareHubNepal matchers, built once instead of a lambda per lookup; the attribute selector keeps
+# the substring match on the date span's classes
+_SHAREHUB_DATE_SELECTOR = 'span[class*="text-grey-500"][class*="font-normal"]'
+_SHAREHUB_NEWS_CONTAINER_CLASS = 'grid grid-cols-1 sm:grid-cols-2 2xl:grid-cols-3 gap-4 md:gap-8 mt-2'
+_SHAREHUB_NEWS_CARD_CLASS = 'flex p-3 rounded-md border hover:cursor-pointer items-center gap-4'
+
+# Requests the browser drops before they hit the network: the scrapers only read the DOM, so
+# images, fonts, media and trackers are never needed. Stylesheets are kept, because the listing
+# waits rely on elements being displayed and clickable.
+_BLOCKED_URL_PATTERNS = [
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg', '*.ico',
+    '*.woff', '*.woff2', '*.ttf', '*.otf', '*.mp4', '*.webm',
+    '*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*',
+    '*googlesyndication.com*', '*facebook.net*',
+]
+
+# Listing extraction runs inside the browser and hands back only the few fields that are used,
+# instead of serializing the whole DOM through page_source and parsing it again in Python.
+# Returns null when the news container is missing, otherwise one {href, title, img} per card.
+_SHAREHUB_CARDS_JS = """
+const byClasses = cls => 'div.' + cls.split(' ').map(CSS.escape).join('.');
+const container = document.querySelector(byClasses(arguments[0]));
+if (!container) return null;
+return Array.from(container.querySelectorAll(byClasses(arguments[1]))).map(card => {
+    const titleSpan = card.querySelector('span[class*="font-semibold"]');
+    let link = card.querySelector('a');  // The main link wraps the whole card
+    if (!(link && link.hasAttribute('href')) && titleSpan) {
+        link = titleSpan.closest('a');  // Fallback if the direct link is not the primary 'a' tag
+    }
+    const img = card.querySelector('img');
+    return {
+        href: link && link.getAttribute('href'),
+        title: titleSpan ? titleSpan.textContent.trim() : '',
+        img: img && img.getAttribute('src'),
+    };
+});
+"""
+
+# Returns the outerHTML of the first element matching each selector argument, concatenated, so only
+# the article nodes that are read cross the WebDriver protocol rather than the whole page source
+_OUTER_HTML_JS = """
+return Array.from(arguments).map(selector => {
+    const element = document.querySelector(selector);
+    return element ? element.outerHTML : '';
+}).join('');
+"""
+
+# Returns null when the listing table (id in arguments[0]) or its body is missing, otherwise
+# one [date, title, href] per row that has a date cell and a title cell with a link
+_NEWS_TABLE_ROWS_JS = """
+const table = document.getElementById(arguments[0]);
+const body = table && table.querySelector('tbody');
+if (!body) return null;
+const rows = [];
+for (const row of body.querySelectorAll('tr')) {
+    const cells = row.querySelectorAll('td');
+    if (cells.length < 2) continue;  // Skip malformed rows
+    const link = cells[1].querySelector('a');
+    if (!link || !link.hasAttribute('href')) continue;
+    rows.push([cells[0].textContent.trim(), link.textContent.trim(), link.getAttribute('href')]);
+}
+return rows;
+"""
+
+def _collect_investopaper_paragraphs(node, paragraphs, state=None):
+    """
+    Walks an Investopaper article body once, appending the text of every readable paragraph.
+
+    Unwanted subtrees (scripts, nested divs, social media buttons, ...) are skipped without being
+    visited. The first paragraph with a bold "Recommended" label starts the recommended-links
+    block, so it and everything after it on the same level are dropped.
+
+    Args:
+        node (selectolax.lexbor.LexborNode): The node whose children are visited.
+        paragraphs (list): Receives the cleaned paragraph texts in document order.
+        state (dict): Internal bookkeeping shared across the recursion.
+    """
+    if state is None:
+        state = {'recommended_seen': False}
+
+    for child in node.iter():
+        tag = child.tag
+        if tag in _BAD_CHILDREN or not _BAD_CLASSES.isdisjoint((child.attributes.get('class') or '').split()):
+            continue
+
+        if tag != 'p':
+            _collect_investopaper_paragraphs(child, paragraphs, state)
+            continue
+
+        # Inline junk (e.g. a <script> inside a paragraph) must not leak into the text
+        for element in child.css(_BAD_CHILDREN_SELECTOR):
+            element.decompose()
+
+        # Extract the text once; the <strong> lookup only runs for paragraphs that mention "Recommended"
+        text = child.text(strip=True)
+        if not state['recommended_seen'] and 'Recommended' in text and child.css_first('strong'):
+            state['recommended_seen'] = True
+            break
+
+        if text and not text.startswith(_BOILER_PREFIXES):
+            paragraphs.append(text)
+
+def _extract_paragraphs(node, selector='p'):
+    """
+    Collects the text of the paragraph-like elements under a node, skipping empty
+    and boilerplate (copyright, license, author) lines.
+
+    Args:
+        node (selectolax.lexbor.LexborNode): The article body.
+        selector (str): The CSS selector for the elements whose text is collected.
+
+    Returns:
+        list: The cleaned texts in document order.
+    """
+    paragraphs = []
+    for element in node.css(selector):
+        text = element.text(strip=True)
+        if text and not text.startswith(_BOILER_PREFIXES):
+            paragraphs.append(text)
+    return paragraphs
+
+class RateLimiter:
+    """
+    Thread-safe token bucket that spaces requests out to at most `rate` per second, letting
+    up to `burst` requests through back to back while the bucket is full.
+    """
+    def __init__(self, rate, burst=1):
+        self.interval = 1.0 / rate
+        # How far behind the current time the next slot may fall, i.e. the bucket's capacity
+        self._allowance = (burst - 1) * self.interval
+        self._lock = threading.Lock()
+        self._next_slot = time.monotonic() - self._allowance
+
+    def acquire(self):
+        """
+        Blocks until the caller is allowed to issue its next request.
+        """
+        with self._lock:
+            now = time.monotonic()
+            slot = max(self._next_slot, now - self._allowance)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
 
 class NepseNewsScraper:
     def __init__(self):
@@ -26,45 +217,173 @@ class NepseNewsScraper:
         self.data_dir = "data"
         os.makedirs(self.data_dir, exist_ok=True)
 
+        # Shared HTTP session so TCP+TLS connections are reused across requests.
+        # Responses are cached on disk for a few hours so re-runs skip the network; once an
+        # entry expires requests-cache revalidates it with If-None-Match/If-Modified-Since.
+        self.session = requests_cache.CachedSession(
+            os.path.join(self.data_dir, 'http_cache'),
+            backend='sqlite',
+            # Published articles rarely change; the Investopaper search page does, so it expires
+            # sooner. The other sites' listings are loaded by Selenium and never reach this session.
+            expire_after=timedelta(days=30),
+            urls_expire_after={
+                '*/?s=*': timedelta(hours=6),
+            },
+            stale_if_error=True, # Fall back to the last good body on transient network errors
+            allowable_codes=(200,)
+        )
+        self.session.headers.update(self.headers)
+        # Advertise every compression scheme urllib3 can decode here (gzip/deflate, plus br if brotli is installed)
+        self.session.headers['Accept-Encoding'] = make_headers(accept_encoding=True)['accept-encoding']
+        self.session.headers['Accept'] = 'text/html,application/xhtml+xml'
+        adapter = HTTPAdapter(
+            pool_connections=8, # One pool per host; only four hosts are contacted
+            # The most sockets one host needs at once: a browser source's article prefetch runs up to
+            # max_workers (8) fetches; Investopaper is held to 4 by its fetch semaphore
+            pool_maxsize=8,
+            # Back off only when the server asks us to: 429/503 responses are retried after
+            # their Retry-After delay instead of sleeping unconditionally between requests
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=(429, 500, 502, 503, 504),
+                respect_retry_after_header=True
+            )
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        # Article pages are fetched concurrently, spaced out per host so independent sites run
+        # in parallel: Investopaper is served over plain HTTP at up to 8 requests per second,
+        # the browser-driven sites are held to one request per second on average, with a short
+        # burst so a listing's article prefetch can start several pages at once
+        self.max_workers = 8
+        self.timeout = (3.05, 10) # (connect, read) seconds
+        self.rate_limiters = {
+            urlparse(self.investopaper_base_url).netloc: RateLimiter(rate=8),
+            urlparse(self.sharehub_base_url).netloc: RateLimiter(rate=1, burst=4),
+            urlparse(self.nepsealpha_base_url).netloc: RateLimiter(rate=1, burst=4),
+            urlparse(self.sharesansar_base_url).netloc: RateLimiter(rate=1, burst=4),
+        }
+        # Caps the sockets open to a plain-HTTP host at once, however many symbols' article
+        # workers are running; parsing happens after the slot is released
+        self.fetch_semaphores = {
+            urlparse(self.investopaper_base_url).netloc: threading.BoundedSemaphore(4),
+        }
+
+        # Parsed article bodies, so re-runs skip fetching and cleaning known articles
+        self.article_cache = ArticleCache(os.path.join(self.data_dir, 'articles.db'))
+
+        # Set for the duration of a forced re-scrape: every cache layer (saved news, parsed
+        # articles, HTTP responses) is bypassed, and the fresh results overwrite it
+        self.force_refresh = False
+
+        # Small in-memory LRU of parse results keyed by a digest of the page body
+        self._parsed_articles = OrderedDict()
+        self._parsed_articles_lock = threading.Lock()
+
+        # Canonical article links already claimed by a source, per symbol, so a story that
+        # is listed twice (across sources or pages) is only fetched once
+        self._seen_links = {}
+        self._seen_links_lock = threading.Lock()
+
+        # One headless Chrome per browser worker thread, reused across symbols instead of being
+        # launched for every source of every symbol. Selenium drivers are not thread-safe, so a
+        # driver never leaves the thread that created it; all of them are quit at exit.
+        self._selenium_executor = ThreadPoolExecutor(max_workers=3, thread_name_prefix='selenium')
+        self._driver_local = threading.local()
+        self._drivers = []
+        self._drivers_lock = threading.Lock()
+        atexit.register(self._quit_drivers)
+
+    def _claim_link(self, symbol, url):
+        """
+        Records an article link for a symbol, reporting whether it had not been seen yet.
+        Sources run on separate threads, so the check and the update happen under a lock.
+
+        Args:
+            symbol (str): The stock symbol the article was listed for.
+            url (str): The article URL.
+
+        Returns:
+            bool: True if this is the first time the link is seen for the symbol.
+        """
+        canonical_url = _canonicalize_url(url)
+        with self._seen_links_lock:
+            seen = self._seen_links.setdefault(symbol, set())
+            if canonical_url in seen:
+                return False
+            seen.add(canonical_url)
+            return True
+
+    def _wait_for_host(self, url):
+        """
+        Blocks until the rate limiter for the URL's host allows another request.
+
+        Args:
+            url (str): The URL about to be requested.
+        """
+        limiter = self.rate_limiters.get(urlparse(url).netloc)
+        if limiter:
+            limiter.acquire()
+
+    def _get(self, url, headers=None):
+        """
+        Issues a rate-limited GET through the shared session, holding one of the host's
+        fetch slots only while the response is downloaded.
+
+        Args:
+            url (str): The URL to fetch.
+            headers (dict): Extra request headers, if any.
+
+        Returns:
+            requests.Response: The response, with its body already read.
+        """
+        semaphore = self.fetch_semaphores.get(urlparse(url).netloc)
+        self._wait_for_host(url)
+        if semaphore is None:
+            return self.session.get(url, headers=headers, timeout=self.timeout, force_refresh=self.force_refresh)
+        with semaphore:
+            return self.session.get(url, headers=headers, timeout=self.timeout, force_refresh=self.force_refresh)
+
+    def close(self):
+        """
+        Quits the browser drivers, releases the pooled HTTP connections and flushes the article cache.
+        """
+        self._selenium_executor.shutdown(wait=True)
+        self._quit_drivers()
+        self.session.close()
+        self.article_cache.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     def _scrape_full_article_investopaper(self, url):
         """
         Helper function to scrape the full content of an Investopaper article.
         """
         try:
-            response = requests.get(url, headers=self.headers, timeout=10)
+            cached_content = None if self.force_refresh else self.article_cache.get(url)
+            if cached_content is not None:
+                return cached_content
+
+            # An expired page is revalidated by requests-cache with its stored validators, so an
+            # unchanged article costs a header exchange instead of a download
+            response = self._get(url)
             response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            article_content = soup.find('div', class_='entry-content')
-            if not article_content:
+            paragraphs = self._parse_investopaper_article(response.content)
+            if paragraphs is None:
                 return "Full article content not found"
             
-            # Remove unwanted elements (scripts, styles, ads, etc.)
-            for element in article_content.find_all(['div', 'script', 'style', 'aside', 'pre', 'hr']):
-                element.decompose()
-                
-            # Remove social media buttons
-            for element in article_content.find_all(class_=['sfsiaftrpstwpr', 'sfsi_responsive_icons']):
-                element.decompose()
-                
-            # Remove recommended links (specific to Investopaper structure)
-            for element in article_content.find_all('p'):
-                if element.find('strong') and 'Recommended' in element.get_text():
-                    for sibling in element.find_next_siblings():
-                        if sibling.name == 'hr':
-                            break
-                        sibling.decompose()
-                    element.decompose()
-                    break
-            
-            # Clean paragraphs
-            paragraphs = []
-            for p in article_content.find_all('p'):
-                text = p.get_text(strip=True)
-                if text and not text.startswith(('©', 'License:', 'Author:')):
-                    paragraphs.append(text)
-            
-            return '\n\n'.join(paragraphs) if paragraphs else "No readable content found"
+            if not paragraphs:
+                return "No readable content found"
+
+            full_content = '\n\n'.join(paragraphs)
+            self.article_cache.put(url, full_content)
+            return full_content
             
         except requests.exceptions.RequestException as e:
             print(f"    [Investopaper] Error scraping full article from {url}: {e}")
@@ -73,10 +392,110 @@ class NepseNewsScraper:
             print(f"    [Investopaper] General error scraping full article from {url}: {e}")
             return "Error retrieving full article content"
 
-    def _scrape_investopaper_news(self, symbol):
+    def _parse_investopaper_article(self, body):
+        """
+        Extracts the readable paragraphs of an Investopaper article page.
+        Results are memoized by a digest of the raw body, so a page that comes back
+        byte-for-byte identical (duplicate or retried URLs) is only parsed once.
+
+        Args:
+            body (bytes): The raw response body.
+
+        Returns:
+            tuple: The paragraph texts, or None if the article body was not found.
+        """
+        digest = hashlib.blake2b(body, digest_size=16).digest()
+        with self._parsed_articles_lock:
+            if digest in self._parsed_articles:
+                self._parsed_articles.move_to_end(digest)
+                return self._parsed_articles[digest]
+
+        tree = LexborHTMLParser(body, encoding=True)
+        article_content = tree.css_first('div.entry-content')
+        paragraphs = None
+        if article_content:
+            collected = []
+            _collect_investopaper_paragraphs(article_content, collected)
+            paragraphs = tuple(collected)
+
+        with self._parsed_articles_lock:
+            self._parsed_articles[digest] = paragraphs
+            if len(self._parsed_articles) > 256:
+                self._parsed_articles.popitem(last=False)
+        return paragraphs
+
+    def _parse_investopaper_listing(self, html, symbol):
+        """
+        Extracts the article metadata from an Investopaper search results page.
+        The parsed tree only lives for the duration of this call, so it is released
+        before the article pages are fetched.
+
+        Args:
+            html (bytes): The raw search results page.
+            symbol (str): The company symbol, used for log messages.
+
+        Returns:
+            list: News item dictionaries with 'full_content' left as None.
+        """
+        news_items = []
+        tree = LexborHTMLParser(html, encoding=True)
+        
+        articles = tree.css('div.article-container article')
+        if not articles:
+            print(f"  [Investopaper] No article container found for {symbol}.")
+            return []
+        
+        for article in articles:
+            try:
+                css_first = article.css_first
+                title_element = css_first('h2.entry-title')
+                title = title_element.text(strip=True) if title_element else "No title"
+                link_element = title_element.css_first('a') if title_element else None
+                link = (link_element.attributes.get('href') or "#") if link_element else "#"
+                
+                if link == "#":
+                    continue
+                    
+                # The first paragraph reads "<date> | <summary>"; extract its text once and split it once
+                date_element = css_first('div.entry-content p')
+                if date_element:
+                    date_text, _, rest = date_element.text().partition('|')
+                    date_text = date_text.strip()
+                    summary = rest.partition('|')[0].strip()
+                else:
+                    date_text = "Unknown date"
+                    summary = ""
+                
+                categories = [cat.text(strip=True) for cat in article.css('a[rel="category tag"]')]
+                
+                image_element = css_first('img')
+                image_attrs = image_element.attributes if image_element else {}
+                image_url = image_attrs.get('data-src') or image_attrs.get('src')
+                
+                news_items.append({
+                    'title': title,
+                    'link': link,
+                    'date': date_text,
+                    'summary': summary,
+                    # Replaced once the article page is fetched; stays a failure if that never happens
+                    'full_content': "Error retrieving full article content",
+                    'categories': categories,
+                    'image_url': image_url,
+                    'source': 'Investopaper'
+                })
+                
+            except Exception as e:
+                print(f"  [Investopaper] Error parsing article for {symbol}: {e}")
+                continue
+
+        return news_items
+
+    def _scrape_investopaper_news(self, symbol, known=None):
         """
         Scrapes news articles for a given stock symbol from investopaper.com.
+        Articles already present in `known` are reused instead of being fetched again.
         """
+        known = known or {}
         news_items = []
         url_template = f"{self.investopaper_base_url}/?s={{symbol}}"
         
@@ -84,69 +503,26 @@ class NepseNewsScraper:
 
         try:
             url = url_template.format(symbol=quote(symbol))
-            response = requests.get(url, headers=self.headers, timeout=10)
+            response = self._get(url)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.text, 'html.parser')
+            news_items = [
+                known.get(item['link'], item) for item in self._parse_investopaper_listing(response.content, symbol)
+                if self._claim_link(symbol, item['link'])
+            ]
+            new_items = [item for item in news_items if item['link'] not in known]
             
-            article_container = soup.find('div', class_='article-container')
-            if not article_container:
-                print(f"  [Investopaper] No article container found for {symbol}.")
-                return []
-            
-            articles = article_container.find_all('article')
-            for article in articles:
-                try:
-                    title_element = article.find('h2', class_='entry-title')
-                    title = title_element.get_text(strip=True) if title_element else "No title"
-                    link = title_element.find('a')['href'] if title_element and title_element.find('a') else "#"
-                    
-                    if link == "#":
-                        continue
-                        
-                    date_element = article.find('div', class_='entry-content').find('p')
-                    date_text = date_element.get_text(strip=True).split('|')[0].strip() if date_element else "Unknown date"
-                    
-                    summary = ""
-                    if date_element:
-                        content_parts = date_element.get_text().split('|')
-                        if len(content_parts) > 1:
-                            summary = content_parts[1].strip()
-                    
-                    categories = []
-                    category_elements = article.find_all('a', rel='category tag')
-                    for cat in category_elements:
-                        categories.append(cat.get_text(strip=True))
-                    
-                    image_element = article.find('img')
-                    image_url = image_element['data-src'] if image_element and 'data-src' in image_element.attrs else (
-                        image_element['src'] if image_element and 'src' in image_element.attrs else None
-                    )
-                    
-                    full_content = self._scrape_full_article_investopaper(link)
-                    
-                    news_items.append({
-                        'title': title,
-                        'link': link,
-                        'date': date_text,
-                        'summary': summary,
-                        'full_content': full_content,
-                        'categories': categories,
-                        'image_url': image_url,
-                        'source': 'Investopaper'
-                    })
-                    
-                    time.sleep(1)
-                    
-                except Exception as e:
-                    print(f"  [Investopaper] Error parsing article for {symbol}: {e}")
-                    continue
+            # Fetch the new full article pages concurrently; the rate limiter keeps us polite
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                full_contents = executor.map(self._scrape_full_article_investopaper, [item['link'] for item in new_items])
+                for item, full_content in zip(new_items, full_contents):
+                    item['full_content'] = full_content
             
             # Investopaper pagination logic (not fully implemented for multiple pages in this version)
-            # pagination = soup.find('ul', class_='default-wp-page')
+            # pagination = tree.css_first('ul.default-wp-page')
             # if pagination:
-            #     next_page = pagination.find('li', class_='next')
-            #     if next_page and next_page.find('a'):
+            #     next_page = pagination.css_first('li.next')
+            #     if next_page and next_page.css_first('a'):
             #         pass # Logic to go to next page
                 
         except requests.exceptions.RequestException as e:
@@ -156,64 +532,164 @@ class NepseNewsScraper:
             
         return news_items
 
-    def _scrape_full_article_sharehubnepal(self, driver, url):
+    def _fetch_static_tree(self, url):
         """
-        Helper function to scrape the full content of a ShareHubNepal article using Selenium.
-        
+        Fetches a page over plain HTTP through the shared session and parses it, without
+        involving the browser.
+
+        Args:
+            url (str): The URL of the page.
+
+        Returns:
+            selectolax.lexbor.LexborHTMLParser: The parsed page, or None if it could not be
+                fetched (network error or non-200 response).
+        """
+        try:
+            response = self._get(url)
+        except requests.exceptions.RequestException:
+            return None
+        if response.status_code != 200:
+            return None
+        return LexborHTMLParser(response.content, encoding=True)
+
+    def _prefetch_static_trees(self, urls):
+        """
+        Fetches and parses article pages over plain HTTP concurrently, so the browser-driven
+        sources do not wait on each article in turn. Pages whose parsed content is already
+        cached are skipped.
+
+        Args:
+            urls (list): The article URLs.
+
+        Returns:
+            dict: Parsed pages keyed by URL, with False for pages that could not be fetched so
+                callers go straight to the browser instead of retrying them over HTTP.
+        """
+        if not self.force_refresh:
+            urls = [url for url in urls if self.article_cache.get_entry(url) is None]
+        if not urls:
+            return {}
+        # The per-host rate limiter still spaces the requests out; this only overlaps their latency
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            trees = executor.map(self._fetch_static_tree, urls)
+            return {url: tree if tree is not None else False for url, tree in zip(urls, trees)}
+
+    def _article_tree(self, driver, url, tree, source_name, container_selector, *fragment_selectors):
+        """
+        Returns the parsed page of an article from one of the browser-driven sources. The page
+        fetched over plain HTTP is used when it holds the article body; otherwise the browser
+        loads the page and only the content container (plus `fragment_selectors`) is parsed.
+
         Args:
             driver (selenium.webdriver.remote.webdriver.WebDriver): The Selenium WebDriver instance.
             url (str): The URL of the news article.
+            tree (selectolax.lexbor.LexborHTMLParser): The page, if already fetched over HTTP, or
+                False if that fetch failed; None means it has not been tried yet.
+            source_name (str): The source name used in log messages (e.g., 'Sharesansar').
+            container_selector (str): CSS selector of the element holding the article body.
+            *fragment_selectors (str): Further elements the parser reads, such as the date.
 
         Returns:
-            tuple: A tuple containing (str: full article content, str: publish date).
-                Returns ("Error retrieving full article content", None) on error.
+            tuple: (selectolax.lexbor.LexborHTMLParser: the parsed page, None), or
+                (None, str: error message) if the browser could not load the article.
         """
+        if tree is None:
+            tree = self._fetch_static_tree(url)
+        if tree is not None and tree is not False and tree.css_first(container_selector):
+            return tree, None
+
         try:
-            print(f"    [ShareHubNepal] Navigating to article: {url}")
+            print(f"    [{source_name}] Navigating to article: {url}")
+            self._wait_for_host(url)
             driver.get(url)
-            
+
             # Wait for the main content div to be present
             WebDriverWait(driver, 15).until(
-                EC.presence_of_element_located((By.ID, "post-content"))
+                EC.presence_of_element_located((By.CSS_SELECTOR, container_selector))
             )
-            
-            article_soup = BeautifulSoup(driver.page_source, 'html.parser')
-            article_content_div = article_soup.find('div', id='post-content')
-            article_header = article_soup.find('header', class_='py-3')
-
-            publish_date = None
-            full_content = "No readable content found"
-
-            if article_header:
-                # Extract publish date
-                # The date is in a span with classes like 'text-grey-500' and 'font-normal'
-                date_tag = article_header.find('span', class_=lambda x: x and 'text-grey-500' in x and 'font-normal' in x)
-                if date_tag:
-                    publish_date = date_tag.get_text(strip=True)
-
-            if article_content_div:
-                # Collect text from various heading and paragraph tags
-                paragraphs = article_content_div.find_all(['p', 'h2', 'h3', 'h4', 'h5', 'h6'])
-                content_parts = []
-                for p in paragraphs:
-                    text = p.get_text(strip=True)
-                    if text:
-                        content_parts.append(text)
-                full_content = '\n\n'.join(content_parts) if content_parts else "No readable content found"
-
-            return full_content, publish_date
-                
+
+            return self._page_fragment(driver, container_selector, *fragment_selectors), None
         except TimeoutException:
-            print(f"    [ShareHubNepal] Timeout waiting for article content on {url}")
-            return "Timeout retrieving full article content", None
+            print(f"    [{source_name}] Timeout waiting for article content on {url}")
+            return None, "Timeout retrieving full article content"
         except WebDriverException as e:
-            print(f"    [ShareHubNepal] WebDriver error scraping full article from {url}: {e}")
-            return "Error retrieving full article content", None
+            print(f"    [{source_name}] WebDriver error scraping full article from {url}: {e}")
+            return None, "Error retrieving full article content"
         except Exception as e:
-            print(f"    [ShareHubNepal] General error scraping full article from {url}: {e}")
-            return "Error retrieving full article content", None
+            print(f"    [{source_name}] General error scraping full article from {url}: {e}")
+            return None, "Error retrieving full article content"
+
+    def _page_fragment(self, driver, *selectors):
+        """
+        Parses just the elements of the current browser page that match `selectors`.
+
+        Args:
+            driver (selenium.webdriver.remote.webdriver.WebDriver): The Selenium WebDriver instance.
+            *selectors (str): CSS selectors; the first match of each is kept.
+
+        Returns:
+            selectolax.lexbor.LexborHTMLParser: A tree holding the matched elements.
+        """
+        return LexborHTMLParser(driver.execute_script(_OUTER_HTML_JS, *selectors))
+
+    def _parse_sharehubnepal_article(self, tree):
+        """
+        Extracts the content and publish date of a parsed ShareHubNepal article page.
+
+        Args:
+            tree (selectolax.lexbor.LexborHTMLParser): The parsed article page.
+
+        Returns:
+            tuple: A tuple containing (str: full article content, str: publish date).
+        """
+        article_content_div = tree.css_first('div#post-content')
+        article_header = tree.css_first('header.py-3')
+
+        publish_date = None
+        full_content = "No readable content found"
+
+        if article_header:
+            # Extract publish date
+            # The date is in a span with classes like 'text-grey-500' and 'font-normal'
+            date_tag = article_header.css_first(_SHAREHUB_DATE_SELECTOR)
+            if date_tag:
+                publish_date = date_tag.text(strip=True)
 
-    def _scrape_sharehubnepal_news(self, driver, symbol):
+        if article_content_div:
+            # Collect text from various heading and paragraph tags
+            content_parts = _extract_paragraphs(article_content_div, 'p, h2, h3, h4, h5, h6')
+            full_content = '\n\n'.join(content_parts) if content_parts else "No readable content found"
+
+        return full_content, publish_date
+
+    def _scrape_full_article_sharehubnepal(self, driver, url, tree=None):
+        """
+        Helper function to scrape the full content of a ShareHubNepal article.
+        
+        Args:
+            driver (selenium.webdriver.remote.webdriver.WebDriver): The Selenium WebDriver instance.
+            url (str): The URL of the news article.
+            tree (selectolax.lexbor.LexborHTMLParser, optional): The page, if already fetched over HTTP,
+                or False if that fetch failed.
+
+        Returns:
+            tuple: A tuple containing (str: full article content, str: publish date).
+                Returns ("Error retrieving full article content", None) on error.
+        """
+        # Parsed articles (and their dates) are kept across runs, so known URLs skip the fetch entirely
+        cached = None if self.force_refresh else self.article_cache.get_entry(url)
+        if cached is not None:
+            return cached
+
+        tree, error = self._article_tree(driver, url, tree, 'ShareHubNepal', 'div#post-content', 'header.py-3')
+        if error:
+            return error, None
+
+        content, published = self._parse_sharehubnepal_article(tree)
+        self.article_cache.put(url, content, published=published)
+        return content, published
+
+    def _scrape_sharehubnepal_news(self, driver, symbol, known=None):
         """
         Scrapes news articles for a given stock symbol from sharehubnepal.com.
         This function uses Selenium to interact with the dynamic content.
@@ -221,6 +697,7 @@ class NepseNewsScraper:
         Args:
             driver (selenium.webdriver.remote.webdriver.WebDriver): The Selenium WebDriver instance.
             symbol (str): The company symbol (e.g., 'ACLBSL').
+            known (dict): Previously saved news items keyed by link; these are not fetched again.
 
         Returns:
             list: A list of dictionaries, where each dictionary contains
@@ -228,21 +705,28 @@ class NepseNewsScraper:
                 'categories', 'image_url', and 'source'.
         """
         news_list_url = f"{self.sharehub_base_url}/company/{symbol}/news"
+        known = known or {}
         articles_data = []
 
         print(f"  [ShareHubNepal] Fetching news list for {symbol} from {news_list_url}")
 
         try:
+            self._wait_for_host(news_list_url)
             driver.get(news_list_url)
             
             # ShareHubNepal news seems to be directly loaded on the URL, no tab click needed.
             # Wait for the news container to be visible
-            news_container_class = 'grid grid-cols-1 sm:grid-cols-2 2xl:grid-cols-3 gap-4 md:gap-8 mt-2'
             try:
                 WebDriverWait(driver, 20).until(
-                    EC.visibility_of_element_located((By.CLASS_NAME, news_container_class.split(' ')[0])) # Use first class for simplicity
+                    EC.visibility_of_element_located((By.CLASS_NAME, _SHAREHUB_NEWS_CONTAINER_CLASS.split(' ')[0])) # Use first class for simplicity
                 )
-                time.sleep(2) # Give a little extra time for all cards to render
+                # Give the cards a moment to render, but stop waiting as soon as the first one is in
+                try:
+                    WebDriverWait(driver, 2).until(
+                        EC.presence_of_element_located((By.CSS_SELECTOR, 'div.rounded-md.border.items-center'))
+                    )
+                except TimeoutException:
+                    pass
             except TimeoutException:
                 print(f"  [ShareHubNepal] Timeout waiting for news container to be visible.")
                 return []
@@ -250,63 +734,51 @@ class NepseNewsScraper:
                 print(f"  [ShareHubNepal] Error waiting for news container: {e}")
                 return []
 
-            soup = BeautifulSoup(driver.page_source, 'html.parser')
-
-            news_container = soup.find('div', class_=news_container_class)
+            # News items are in divs with specific classes inside the news container
+            news_cards = driver.execute_script(_SHAREHUB_CARDS_JS, _SHAREHUB_NEWS_CONTAINER_CLASS, _SHAREHUB_NEWS_CARD_CLASS)
 
-            if not news_container:
+            if news_cards is None:
                 print(f"  [ShareHubNepal] No news container found for {symbol}.")
                 return []
 
-            # News items are in divs with specific classes
-            news_items_html = news_container.find_all('div', class_='flex p-3 rounded-md border hover:cursor-pointer items-center gap-4')
-
-            if not news_items_html:
+            if not news_cards:
                 print(f"  [ShareHubNepal] No news items found for {symbol}.")
                 return []
 
-            for item_html in news_items_html:
+            entries = []
+            for card in news_cards:
+                article_relative_url = card['href']
+                if not article_relative_url:
+                    print("  [ShareHubNepal] Could not find a valid link within the news item. Skipping.")
+                    continue
+
+                article_url = urljoin(self.sharehub_base_url, article_relative_url)
+                if self._claim_link(symbol, article_url): # Skip links already listed on this or another source
+                    entries.append((card, article_url))
+
+            # Fetch the new article pages concurrently up front; the driver is only needed for
+            # pages whose body does not come back in the server-rendered HTML
+            trees = self._prefetch_static_trees([url for _, url in entries if url not in known])
+
+            for card, article_url in entries:
                 try:
-                    article_relative_url = None
-                    link_tag = item_html.find('a') # The main link wraps the whole card
-                    if link_tag and 'href' in link_tag.attrs:
-                        article_relative_url = link_tag['href']
-                    else:
-                        # Fallback if the direct link is not the primary 'a' tag
-                        title_span = item_html.find('span', class_=lambda x: x and 'font-semibold' in x)
-                        if title_span:
-                            parent_link = title_span.find_parent('a')
-                            if parent_link and 'href' in parent_link.attrs:
-                                article_relative_url = parent_link['href']
-
-                    if not article_relative_url:
-                        print("  [ShareHubNepal] Could not find a valid link within the news item. Skipping.")
+                    if article_url in known:
+                        articles_data.append(known[article_url])
                         continue
-
-                    article_url = urljoin(self.sharehub_base_url, article_relative_url)
                     print(f"    [ShareHubNepal] Scraping article from: {article_url}")
 
-                    full_content, publish_date = self._scrape_full_article_sharehubnepal(driver, article_url)
-                    
-                    # Extract title from the listing card
-                    title_span_in_list = item_html.find('span', class_=lambda x: x and 'font-semibold' in x)
-                    title = title_span_in_list.get_text(strip=True) if title_span_in_list else ""
-                    
-                    # Extract image URL from listing
-                    image_element = item_html.find('img')
-                    image_url = image_element['src'] if image_element and 'src' in image_element.attrs else None
+                    full_content, publish_date = self._scrape_full_article_sharehubnepal(driver, article_url, trees.get(article_url))
 
                     articles_data.append({
-                        'title': title,
+                        'title': card['title'], # Title and image come from the listing card
                         'link': article_url,
                         'date': publish_date,
                         'summary': None, # ShareHubNepal doesn't provide summary in listing
                         'full_content': full_content,
                         'categories': [], # ShareHubNepal doesn't provide categories in listing
-                        'image_url': image_url,
+                        'image_url': card['img'],
                         'source': 'ShareHubNepal'
                     })
-                    time.sleep(1) # Be polite to the server
 
                 except Exception as e:
                     print(f"  [ShareHubNepal] Error processing news item for {symbol}: {e}")
@@ -321,65 +793,83 @@ class NepseNewsScraper:
         
 
 
-    def _scrape_full_article_nepsealpha(self, driver, url):
+    def _parse_nepsealpha_article(self, tree):
+        """
+        Extracts the content and date of a parsed NepseAlpha article page.
+
+        Args:
+            tree (selectolax.lexbor.LexborHTMLParser): The parsed article page.
+
+        Returns:
+            tuple: A tuple containing (str: full article content, str: article date).
+        """
+        # Extract article date from post details
+        article_date = None
+        date_element = tree.css_first('li.detail.date')
+        if date_element:
+            article_date = date_element.text(strip=True)
+        
+        # Extract main content
+        content_div = tree.css_first('div#postDescriptions')
+        if not content_div:
+            return "Content not found", article_date
+        
+        # Clean and get text (remove unwanted elements within the content div)
+        # Note: The user's original NepseAlpha snippet did not have explicit element removal
+        # but it's good practice. I'll stick to the user's provided filtering for paragraphs.
+        
+        paragraphs = _extract_paragraphs(content_div)
+        
+        content = '\n\n'.join(paragraphs) if paragraphs else "No readable content found"
+        return content, article_date
+
+    def _wait_for_table_rows(self, driver, table_id, timeout=3):
+        """
+        Waits until a listing table has at least one data row with a link. The placeholder row
+        DataTables shows while loading (or when empty) has none, so it does not end the wait.
+        A table can legitimately be empty, so after `timeout` seconds the caller simply carries
+        on with whatever has rendered.
+
+        Args:
+            driver (selenium.webdriver.remote.webdriver.WebDriver): The Selenium WebDriver instance.
+            table_id (str): The id of the table element.
+            timeout (float): The longest time to wait, in seconds.
+        """
+        try:
+            WebDriverWait(driver, timeout).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, f'#{table_id} tbody tr td a[href]'))
+            )
+        except TimeoutException:
+            pass
+
+    def _scrape_full_article_nepsealpha(self, driver, url, tree=None):
         """
-        Helper function to scrape the full content of a NepseAlpha article using Selenium.
+        Helper function to scrape the full content of a NepseAlpha article.
         
         Args:
             driver (selenium.webdriver.remote.webdriver.WebDriver): The Selenium WebDriver instance.
             url (str): The URL of the news article.
+            tree (selectolax.lexbor.LexborHTMLParser, optional): The page, if already fetched over HTTP,
+                or False if that fetch failed.
 
         Returns:
             tuple: A tuple containing (str: full article content, str: article date).
                 Returns ("Error retrieving full article content", None) on error.
         """
-        try:
-            print(f"    [NepseAlpha] Navigating to article: {url}")
-            driver.get(url)
-            
-            # Wait for the main content div to be present
-            WebDriverWait(driver, 15).until(
-                EC.presence_of_element_located((By.ID, "postDescriptions"))
-            )
-            
-            soup = BeautifulSoup(driver.page_source, 'html.parser')
-            
-            # Extract article date from post details
-            article_date = None
-            date_element = soup.find('li', class_='detail date')
-            if date_element:
-                article_date = date_element.get_text(strip=True)
-            
-            # Extract main content
-            content_div = soup.find('div', {'id': 'postDescriptions'})
-            if not content_div:
-                print(f"    [NepseAlpha] Content div 'postDescriptions' not found for {url}")
-                return "Content not found", article_date
-            
-            # Clean and get text (remove unwanted elements within the content div)
-            # Note: The user's original NepseAlpha snippet did not have explicit element removal
-            # but it's good practice. I'll stick to the user's provided filtering for paragraphs.
-            
-            paragraphs = []
-            for p in content_div.find_all('p'):
-                text = p.get_text(strip=True)
-                if text and not text.startswith(('©', 'License:', 'Author:')):
-                    paragraphs.append(text)
-            
-            content = '\n\n'.join(paragraphs) if paragraphs else "No readable content found"
-            return content, article_date
-                
-        except TimeoutException:
-            print(f"    [NepseAlpha] Timeout waiting for article content on {url}")
-            return "Timeout retrieving full article content", None
-        except WebDriverException as e:
-            print(f"    [NepseAlpha] WebDriver error scraping full article from {url}: {e}")
-            return "Error retrieving full article content", None
-        except Exception as e:
-            print(f"    [NepseAlpha] General error scraping full article from {url}: {e}")
-            return "Error retrieving full article content", None
+        # Parsed articles (and their dates) are kept across runs, so known URLs skip the fetch entirely
+        cached = None if self.force_refresh else self.article_cache.get_entry(url)
+        if cached is not None:
+            return cached
+
+        tree, error = self._article_tree(driver, url, tree, 'NepseAlpha', 'div#postDescriptions', 'li.detail.date')
+        if error:
+            return error, None
+
+        content, published = self._parse_nepsealpha_article(tree)
+        self.article_cache.put(url, content, published=published)
+        return content, published
 
-    def _scrape_nepsealpha_news(self, driver, symbol):
+    def _scrape_nepsealpha_news(self, driver, symbol, known=None):
         """
         Scrapes news articles for a given stock symbol from nepsealpha.com.
         This function uses Selenium to interact with the dynamic content.
@@ -388,18 +878,21 @@ class NepseNewsScraper:
             driver (selenium.webdriver.remote.webdriver.WebDriver): The Selenium WebDriver instance.
             nepsealpha_base_url (str): The base URL for NepseAlpha (e.g., "https://www.nepsealpha.com").
             symbol (str): The company symbol (e.g., 'NABIL').
+            known (dict): Previously saved news items keyed by link; these are not fetched again.
 
         Returns:
             list: A list of dictionaries, where each dictionary contains
                 'title', 'link', 'date', 'summary', 'full_content',
                 'categories', 'image_url', and 'source'.
         """
+        known = known or {}
         news_items = []
         search_url = f"{self.nepsealpha_base_url}/search?q={symbol}"
         
         print(f"  [NepseAlpha] Fetching news list for {symbol} from {search_url}")
 
         try:
+            self._wait_for_host(search_url)
             driver.get(search_url)
 
             # --- Click the 'News' tab ---
@@ -412,8 +905,8 @@ class NepseNewsScraper:
                     EC.element_to_be_clickable((By.XPATH, news_tab_xpath))
                 )
                 news_tab.click()
-                # Give some time for the content to load after clicking the tab
-                time.sleep(3) # A short pause to allow JS to render the table
+                # Give the table a moment to fill in after clicking the tab, moving on as soon as a row is in
+                self._wait_for_table_rows(driver, 'news_tables')
             except TimeoutException:
                 print(f"  [NepseAlpha] Timeout waiting for News tab to be clickable.")
                 return []
@@ -429,38 +922,35 @@ class NepseNewsScraper:
                 WebDriverWait(driver, 20).until(
                     EC.visibility_of_element_located((By.ID, news_table_id))
                 )
-                # Get the page source after dynamic content has loaded
-                soup = BeautifulSoup(driver.page_source, 'html.parser')
-
-                news_table = soup.find('table', id=news_table_id)
-                if not news_table:
+                # Read the rows after dynamic content has loaded, straight from the browser's DOM
+                rows = driver.execute_script(_NEWS_TABLE_ROWS_JS, news_table_id)
+                if rows is None:
                     print("  [NepseAlpha] News table 'news_tables' not found after clicking tab.")
                     return []
 
-                rows = news_table.find('tbody').find_all('tr')
                 if not rows:
                     print("  [NepseAlpha] No news rows found in the table.")
                     return []
 
-                for row in rows:
+                entries = []
+                for date_from_list, title, article_url in rows: # Date from the listing table
+                    if not article_url.startswith('http'):
+                        article_url = urljoin(self.nepsealpha_base_url, article_url)
+                    if self._claim_link(symbol, article_url): # Skip links already listed on this or another source
+                        entries.append((date_from_list, title, article_url))
+
+                # Fetch the new article pages concurrently up front; the driver is only needed for
+                # pages whose body does not come back in the server-rendered HTML
+                trees = self._prefetch_static_trees([url for _, _, url in entries if url not in known])
+
+                for date_from_list, title, article_url in entries:
                     try:
-                        cells = row.find_all('td')
-                        if len(cells) < 2:
-                            continue # Skip malformed rows
-                            
-                        date_from_list = cells[0].get_text(strip=True) # Date from the listing table
-                        title_link = cells[1].find('a')
-                        if not title_link:
+                        if article_url in known:
+                            news_items.append(known[article_url])
                             continue
-                            
-                        title = title_link.get_text(strip=True)
-                        article_url = title_link['href']
-                        
-                        if not article_url.startswith('http'):
-                            article_url = urljoin(self.nepsealpha_base_url, article_url)
                         
                         # Scrape the full article content and its specific date
-                        full_content, article_date_from_page = self._scrape_full_article_nepsealpha(driver, article_url)
+                        full_content, article_date_from_page = self._scrape_full_article_nepsealpha(driver, article_url, trees.get(article_url))
                         
                         # Use the date from the article page if available, otherwise use the list date
                         final_date = article_date_from_page if article_date_from_page else date_from_list
@@ -476,8 +966,6 @@ class NepseNewsScraper:
                             'source': 'NepseAlpha'
                         })
                         
-                        time.sleep(1) # Be polite to the server
-                        
                     except Exception as e:
                         print(f"  [NepseAlpha] Error processing news row for {symbol}: {e}")
                         continue
@@ -491,58 +979,57 @@ class NepseNewsScraper:
                 
         return news_items
 
-    def _scrape_full_article_sharesansar(self, driver, url):
+    def _parse_sharesansar_article(self, tree):
         """
-        Helper function to scrape the full content of a Sharesansar article using Selenium.
+        Extracts the content of a parsed Sharesansar article page.
+
+        Args:
+            tree (selectolax.lexbor.LexborHTMLParser): The parsed article page.
+
+        Returns:
+            str: The extracted full article content.
+        """
+        content_div = tree.css_first('div#newsdetail-content')
+        if not content_div:
+            return "Content not found"
+        
+        # Remove unwanted elements in a single selector pass (css() also matches the div itself)
+        for element in content_div.css(_SHARESANSAR_BAD_SELECTOR):
+            if element != content_div:
+                element.decompose()
+            
+        # Find all paragraph tags within the cleaned content div, filtering out unwanted texts
+        paragraphs = _extract_paragraphs(content_div)
+        
+        return '\n\n'.join(paragraphs) if paragraphs else "No readable content found"
+
+    def _scrape_full_article_sharesansar(self, driver, url, tree=None):
+        """
+        Helper function to scrape the full content of a Sharesansar article.
         
         Args:
             driver (selenium.webdriver.remote.webdriver.WebDriver): The Selenium WebDriver instance.
             url (str): The URL of the news article.
+            tree (selectolax.lexbor.LexborHTMLParser, optional): The page, if already fetched over HTTP,
+                or False if that fetch failed.
 
         Returns:
             str: The extracted full article content, or an error message.
         """
-        try:
-            print(f"    [Sharesansar] Navigating to article: {url}")
-            driver.get(url)
-            
-            # Wait for the main content div to be present
-            WebDriverWait(driver, 15).until(
-                EC.presence_of_element_located((By.ID, "newsdetail-content"))
-            )
-            
-            soup = BeautifulSoup(driver.page_source, 'html.parser')
-            
-            content_div = soup.find('div', {'id': 'newsdetail-content'})
-            if not content_div:
-                print(f"    [Sharesansar] Content div 'newsdetail-content' not found for {url}")
-                return "Content not found"
-            
-            # Remove unwanted elements as specified
-            for element in content_div.find_all(['div', 'script', 'style', 'aside', 'figure', 'img']):
-                element.decompose()
-                
-            paragraphs = []
-            # Find all paragraph tags within the cleaned content div
-            for p in content_div.find_all('p'):
-                text = p.get_text(strip=True)
-                # Filter out specific unwanted texts
-                if text and not text.startswith(('©', 'License:', 'Author:')):
-                    paragraphs.append(text)
-            
-            return '\n\n'.join(paragraphs) if paragraphs else "No readable content found"
-            
-        except TimeoutException:
-            print(f"    [Sharesansar] Timeout waiting for article content on {url}")
-            return "Timeout retrieving full article content"
-        except WebDriverException as e:
-            print(f"    [Sharesansar] WebDriver error scraping full article from {url}: {e}")
-            return "Error retrieving full article content"
-        except Exception as e:
-            print(f"    [Sharesansar] General error scraping full article from {url}: {e}")
-            return "Error retrieving full article content"
+        # Parsed articles are kept across runs, so known URLs skip the fetch entirely
+        cached_content = None if self.force_refresh else self.article_cache.get(url)
+        if cached_content is not None:
+            return cached_content
 
-    def _scrape_sharesansar_news(self, driver, symbol):
+        tree, error = self._article_tree(driver, url, tree, 'Sharesansar', 'div#newsdetail-content')
+        if error:
+            return error
+
+        content = self._parse_sharesansar_article(tree)
+        self.article_cache.put(url, content)
+        return content
+
+    def _scrape_sharesansar_news(self, driver, symbol, known=None):
         """
         Scrapes news articles for a given stock symbol from sharesansar.com.
         This function uses Selenium to interact with the dynamic content.
@@ -551,18 +1038,21 @@ class NepseNewsScraper:
             driver (selenium.webdriver.remote.webdriver.WebDriver): The Selenium WebDriver instance.
             sharesansar_base_url (str): The base URL for Sharesansar (e.g., "https://www.sharesansar.com").
             symbol (str): The company symbol (e.g., 'NABIL').
+            known (dict): Previously saved news items keyed by link; these are not fetched again.
 
         Returns:
             list: A list of dictionaries, where each dictionary contains
                 'title', 'link', 'date', 'summary', 'full_content',
                 'categories', 'image_url', and 'source'.
         """
+        known = known or {}
         news_items = []
         company_url = f"{self.sharesansar_base_url}/company/{symbol}"
         
         print(f"  [Sharesansar] Fetching news list for {symbol} from {company_url}")
 
         try:
+            self._wait_for_host(company_url)
             driver.get(company_url)
 
             # --- Click the 'News' tab ---
@@ -574,8 +1064,8 @@ class NepseNewsScraper:
                     EC.element_to_be_clickable((By.ID, news_tab_id))
                 )
                 news_tab.click()
-                # Give some time for the content to load after clicking the tab
-                time.sleep(3) # A short pause to allow JS to render the table
+                # Give the table a moment to fill in after clicking the tab, moving on as soon as a row is in
+                self._wait_for_table_rows(driver, 'myTableCNews')
             except TimeoutException:
                 print(f"  [Sharesansar] Timeout waiting for News tab '{news_tab_id}' to be clickable.")
                 return []
@@ -591,36 +1081,34 @@ class NepseNewsScraper:
                 WebDriverWait(driver, 20).until(
                     EC.visibility_of_element_located((By.ID, news_table_id))
                 )
-                # Get the page source after dynamic content has loaded
-                soup = BeautifulSoup(driver.page_source, 'html.parser')
-
-                news_table = soup.find('table', id=news_table_id)
-                if not news_table:
+                # Read the rows after dynamic content has loaded, straight from the browser's DOM
+                rows = driver.execute_script(_NEWS_TABLE_ROWS_JS, news_table_id)
+                if rows is None:
                     print("  [Sharesansar] News table 'myTableCNews' not found after clicking tab.")
                     return []
 
-                rows = news_table.find('tbody').find_all('tr')
                 if not rows:
                     print("  [Sharesansar] No news rows found in the table.")
                     return []
 
-                for row in rows:
+                entries = []
+                for date, title, relative_url in rows:
+                    full_url = urljoin(self.sharesansar_base_url, relative_url)
+                    if self._claim_link(symbol, full_url): # Skip links already listed on this or another source
+                        entries.append((date, title, full_url))
+
+                # Fetch the new article pages concurrently up front; the driver is only needed for
+                # pages whose body does not come back in the server-rendered HTML
+                trees = self._prefetch_static_trees([url for _, _, url in entries if url not in known])
+
+                for date, title, full_url in entries:
                     try:
-                        cells = row.find_all('td')
-                        if len(cells) < 2:
-                            continue # Skip malformed rows
-                            
-                        date = cells[0].get_text(strip=True)
-                        title_link = cells[1].find('a')
-                        if not title_link:
+                        if full_url in known:
+                            news_items.append(known[full_url])
                             continue
-                            
-                        title = title_link.get_text(strip=True)
-                        relative_url = title_link['href']
-                        full_url = urljoin(self.sharesansar_base_url, relative_url)
                         
                         # Scrape the full article content
-                        full_content = self._scrape_full_article_sharesansar(driver, full_url)
+                        full_content = self._scrape_full_article_sharesansar(driver, full_url, trees.get(full_url))
                         
                         news_items.append({
                             'title': title,
@@ -633,8 +1121,6 @@ class NepseNewsScraper:
                             'source': 'Sharesansar'
                         })
                         
-                        time.sleep(1) # Be polite to the server
-                        
                     except Exception as e:
                         print(f"  [Sharesansar] Error processing news row for {symbol}: {e}")
                         continue
@@ -649,91 +1135,315 @@ class NepseNewsScraper:
         return news_items
 
 
-    def scrape_news(self, symbol):
+    def _write_news_file(self, filename, symbol, news_items):
         """
-        Main method to scrape news for a given symbol from all integrated sources.
-        Combines and standardizes the output.
+        Writes the news items for a symbol as a pretty-printed JSON document.
+
+        Items are serialized and written one at a time with orjson, so the whole document is
+        never materialized as a single string. Nested items are re-indented by prefixing each
+        line break (JSON strings never contain raw newlines), which keeps the output identical
+        to json.dump(..., indent=2, ensure_ascii=False). The data goes to a temp file that is
+        fsynced and renamed over `filename`, so readers never see a half-written file.
+
+        Args:
+            filename (str): Destination path of the JSON file.
+            symbol (str): The stock symbol the news belongs to.
+            news_items (list): The standardized news item dictionaries.
+        """
+        tmp_filename = filename + '.tmp'
+        with open(tmp_filename, 'wb', buffering=1 << 20) as f:
+            f.write(b'{\n  "symbol": ' + orjson.dumps(symbol))
+            f.write(b',\n  "last_updated": ' + orjson.dumps(datetime.now().isoformat()))
+            f.write(b',\n  "news": [')
+            for index, item in enumerate(news_items):
+                f.write(b',\n    ' if index else b'\n    ')
+                f.write(orjson.dumps(item, option=orjson.OPT_INDENT_2).replace(b'\n', b'\n    '))
+            f.write(b'\n  ]\n}' if news_items else b']\n}')
+            # Scraped data is expensive to regenerate, so make sure it is on disk before the rename
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_filename, filename)
+
+    def _create_driver(self):
+        """
+        Builds a headless Chrome WebDriver for the Selenium-based sources.
+        """
+        # It's good practice to use headless mode for scraping
+        options = webdriver.ChromeOptions()
+        options.add_argument('--headless=new')
+        options.add_argument('--no-sandbox')
+        options.add_argument('--disable-dev-shm-usage')
+        options.add_argument('--disable-gpu')
+        # Only the DOM is read, so skip downloading and laying out images
+        options.add_argument('--blink-settings=imagesEnabled=false')
+        options.add_experimental_option('prefs', {
+            'profile.managed_default_content_settings.images': 2,
+            'profile.default_content_setting_values.notifications': 2,
+        })
+        # Return from driver.get() once the DOM is ready; every page is followed by an explicit
+        # WebDriverWait for the element that is actually read
+        options.page_load_strategy = 'eager'
+        driver = webdriver.Chrome(options=options)
+        try:
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': _BLOCKED_URL_PATTERNS})
+        except Exception:
+            # The driver is not registered yet, so nothing else would ever quit this Chrome
+            driver.quit()
+            raise
+        return driver
+
+    def _get_driver(self):
+        """
+        Returns the calling thread's WebDriver, starting one on first use.
+        """
+        driver = getattr(self._driver_local, 'driver', None)
+        if driver is None:
+            driver = self._create_driver()
+            self._driver_local.driver = driver
+            with self._drivers_lock:
+                self._drivers.append(driver)
+        return driver
+
+    def _discard_driver(self):
+        """
+        Quits the calling thread's WebDriver after an error, so the next use starts a fresh one.
+        """
+        driver = getattr(self._driver_local, 'driver', None)
+        if driver is None:
+            return
+        self._driver_local.driver = None
+        with self._drivers_lock:
+            self._drivers.remove(driver)
+        try:
+            driver.quit()
+        except WebDriverException:
+            pass
+
+    def _driver_alive(self, driver):
+        """
+        Reports whether a WebDriver still has a working browser session.
+
+        Args:
+            driver (selenium.webdriver.remote.webdriver.WebDriver): The Selenium WebDriver instance.
+
+        Returns:
+            bool: False if the browser crashed or the session is no longer valid.
+        """
+        try:
+            driver.current_url
+            return True
+        except WebDriverException:
+            return False
+
+    def _quit_drivers(self):
+        """
+        Quits every WebDriver started by the browser workers.
+        """
+        with self._drivers_lock:
+            drivers, self._drivers = self._drivers, []
+        for driver in drivers:
+            try:
+                driver.quit()
+            except WebDriverException:
+                pass
+
+    def _scrape_with_driver(self, source_name, scrape_source, symbol, known=None):
+        """
+        Runs one Selenium-based source on the calling worker thread's headless Chrome instance.
 
         Args:
+            source_name (str): The source name used in log messages (e.g., 'ShareHubNepal').
+            scrape_source (callable): One of the `_scrape_*_news(driver, symbol, known)` methods.
             symbol (str): The stock symbol (e.g., 'NABIL', 'NTC').
+            known (dict): Previously saved news items keyed by link.
 
         Returns:
-            list: A list of dictionaries, where each dictionary represents a news item
-                  in the standardized format.
+            list: The news items scraped from the source (empty on failure).
+        """
+        try:
+            driver = self._get_driver()
+            news = scrape_source(driver, symbol, known)
+        except WebDriverException as e:
+            print(f"  [Selenium] WebDriver error during {source_name} scraping for {symbol}: {e}")
+            print("  [Selenium] Please ensure you have chromedriver installed and in your PATH.")
+            self._discard_driver()
+            return []
+        except Exception as e:
+            print(f"  [Selenium] A general error occurred during {source_name} scraping for {symbol}: {e}")
+            return []
+
+        # The sources handle their own WebDriver errors and return what they have, so a browser
+        # that crashed or lost its session only shows up here; replace it so later symbols on
+        # this worker do not keep failing against a dead driver
+        if not self._driver_alive(driver):
+            print(f"  [Selenium] Browser session lost during {source_name} scraping for {symbol}; restarting it.")
+            self._discard_driver()
+
+        if news:
+            print(f"  [{source_name}] Scraped {len(news)} news items for {symbol}.")
+        else:
+            print(f"  [{source_name}] No news found for {symbol}.")
+        return news
+
+    def _scrape_selenium_sources(self, symbol, known=None):
+        """
+        Scrapes the sources that need a browser (ShareHubNepal, NepseAlpha and Sharesansar).
+        The three sites are independent hosts, so they run concurrently on the browser workers.
+
+        Args:
+            symbol (str): The stock symbol (e.g., 'NABIL', 'NTC').
+            known (dict): Previously saved news items keyed by link; these are not fetched again.
+
+        Returns:
+            list: The combined news items from the Selenium-based sources, in source order.
+        """
+        sources = [
+            ('ShareHubNepal', self._scrape_sharehubnepal_news),
+            ('NepseAlpha', self._scrape_nepsealpha_news),
+            ('Sharesansar', self._scrape_sharesansar_news),
+        ]
+        selenium_news = []
+        futures = [
+            self._selenium_executor.submit(self._scrape_with_driver, source_name, scrape_source, symbol, known)
+            for source_name, scrape_source in sources
+        ]
+        for future in futures:
+            selenium_news.extend(future.result())
+
+        return selenium_news
+
+    def _load_known_news(self, symbol):
+        """
+        Loads the news items saved by a previous run for a symbol, so their articles
+        do not have to be fetched again.
+
+        Args:
+            symbol (str): The stock symbol (e.g., 'NABIL', 'NTC').
+
+        Returns:
+            dict: Maps each article link to its saved news item. Items whose article
+                could not be retrieved last time are left out so they are retried.
+        """
+        filename = os.path.join(self.data_dir, f"{symbol.lower()}_news.json")
+        try:
+            with open(filename, 'rb') as f:
+                prior = orjson.loads(f.read())
+        except FileNotFoundError:
+            return {}
+        except (OSError, orjson.JSONDecodeError) as e:
+            print(f"  Could not read previously saved news from {filename}: {e}")
+            return {}
+
+        known = {}
+        for item in prior.get('news', []):
+            content = item.get('full_content')
+            # Missing or empty bodies count as failures too, so those articles are fetched again
+            if item.get('link') and isinstance(content, str) and content and not content.startswith(_FAILED_CONTENT_PREFIXES):
+                known[item['link']] = item
+        return known
+
+    def _save_news(self, symbol, investopaper_news, selenium_news):
+        """
+        Combines the per-source results for a symbol and saves them to its JSON file.
+
+        Args:
+            symbol (str): The stock symbol (e.g., 'NABIL', 'NTC').
+            investopaper_news (list): News items scraped from Investopaper.
+            selenium_news (list): News items scraped from the Selenium-based sources.
+
+        Returns:
+            list: The combined news items for the symbol.
         """
         all_news_for_symbol = []
-        
-        print(f"\n--- Starting unified news scraping for symbol: {symbol} ---")
 
-        # Scrape from Investopaper
-        investopaper_news = self._scrape_investopaper_news(symbol)
         if investopaper_news:
             all_news_for_symbol.extend(investopaper_news)
             print(f"  [Investopaper] Scraped {len(investopaper_news)} news items for {symbol}.")
         else:
             print(f"  [Investopaper] No news found for {symbol}.")
-        time.sleep(2) # Pause between sources
-
-        # --- Selenium-based scraping ---
-        driver = None
-        try:
-            # It's good practice to use headless mode for scraping
-            options = webdriver.ChromeOptions()
-            options.add_argument('--headless')
-            options.add_argument('--no-sandbox')
-            options.add_argument('--disable-dev-shm-usage')
-            driver = webdriver.Chrome(options=options)
-
-            # Scrape from ShareHubNepal
-            sharehub_news = self._scrape_sharehubnepal_news(driver, symbol)
-            if sharehub_news:
-                all_news_for_symbol.extend(sharehub_news)
-                print(f"  [ShareHubNepal] Scraped {len(sharehub_news)} news items for {symbol}.")
-            else:
-                print(f"  [ShareHubNepal] No news found for {symbol}.")
-            time.sleep(2) # Pause between sources
-
-            # Scrape from NepseAlpha
-            nepsealpha_news = self._scrape_nepsealpha_news(driver, symbol)
-            if nepsealpha_news:
-                all_news_for_symbol.extend(nepsealpha_news)
-                print(f"  [NepseAlpha] Scraped {len(nepsealpha_news)} news items for {symbol}.")
-            else:
-                print(f"  [NepseAlpha] No news found for {symbol}.")
-            time.sleep(2)
-
-            # Scrape from Sharesansar
-            sharesansar_news = self._scrape_sharesansar_news(driver, symbol)
-            if sharesansar_news:
-                all_news_for_symbol.extend(sharesansar_news)
-                print(f"  [Sharesansar] Scraped {len(sharesansar_news)} news items for {symbol}.")
-            else:
-                print(f"  [Sharesansar] No news found for {symbol}.")
-            time.sleep(2)
+        all_news_for_symbol.extend(selenium_news)
 
-        except WebDriverException as e:
-            print(f"  [Selenium] WebDriver error during scraping for {symbol}: {e}")
-            print("  [Selenium] Please ensure you have chromedriver installed and in your PATH.")
-        except Exception as e:
-            print(f"  [Selenium] A general error occurred during selenium scraping for {symbol}: {e}")
-        finally:
-            if driver:
-                driver.quit()
+        # Syndicated stories can reach several sources under different URLs; keep the first copy
+        seen_bodies = set()
+        unique_news = []
+        for item in all_news_for_symbol:
+            content = item.get('full_content')
+            if content and content not in _EMPTY_CONTENTS and not content.startswith(_FAILED_CONTENT_PREFIXES):
+                body_hash = hashlib.sha1(content.encode('utf-8')).digest()
+                if body_hash in seen_bodies:
+                    continue
+                seen_bodies.add(body_hash)
+            unique_news.append(item)
+        all_news_for_symbol = unique_news
         
         print(f"--- Finished unified news scraping for {symbol}. Total news items: {len(all_news_for_symbol)} ---")
         
         # Save the combined news for this symbol to a JSON file
         filename = os.path.join(self.data_dir, f"{symbol.lower()}_news.json")
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump({
-                'symbol': symbol,
-                'last_updated': datetime.now().isoformat(),
-                'news': all_news_for_symbol
-            }, f, indent=2, ensure_ascii=False)
+        self._write_news_file(filename, symbol, all_news_for_symbol)
         print(f"Unified data for {symbol} saved to {filename}")
 
+        # Persist newly parsed articles in one transaction rather than one per article
+        self.article_cache.commit()
+
         return all_news_for_symbol
 
+    def scrape_news(self, symbol, force_refresh=False):
+        """
+        Main method to scrape news for a given symbol from all integrated sources.
+        Combines and standardizes the output.
+
+        Args:
+            symbol (str): The stock symbol (e.g., 'NABIL', 'NTC').
+            force_refresh (bool): Re-download and re-parse everything instead of using cached results.
+
+        Returns:
+            list: A list of dictionaries, where each dictionary represents a news item
+                  in the standardized format.
+        """
+        return self.scrape_symbols([symbol], force_refresh=force_refresh)[symbol]
+
+    def scrape_symbols(self, symbols, force_refresh=False):
+        """
+        Scrapes news for several symbols as a two-stage pipeline.
+
+        The HTTP-only Investopaper stage for every symbol is queued on background threads up
+        front, while the browser stage (ShareHubNepal, NepseAlpha, Sharesansar) works through
+        the symbols one by one. Each symbol is saved as soon as both of its stages are done,
+        so the total wall time is close to the slower stage rather than the sum of both.
+
+        Args:
+            symbols (list): The stock symbols (e.g., ['NABIL', 'NTC']).
+            force_refresh (bool): Re-download and re-parse everything instead of using cached results.
+
+        Returns:
+            dict: Maps each symbol to its list of standardized news items.
+        """
+        symbols = list(dict.fromkeys(symbols))
+        results = {}
+        with self._seen_links_lock:
+            for symbol in symbols:
+                self._seen_links[symbol] = set()
+
+        self.force_refresh = force_refresh
+        try:
+            # Each Investopaper scrape fans out over its own article workers, so two symbols
+            # in flight are enough to keep the shared rate limiter busy
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                known = {symbol: {} if force_refresh else self._load_known_news(symbol) for symbol in symbols}
+                investopaper_futures = {
+                    symbol: executor.submit(self._scrape_investopaper_news, symbol, known[symbol]) for symbol in symbols
+                }
+                for symbol in symbols:
+                    print(f"\n--- Starting unified news scraping for symbol: {symbol} ---")
+                    selenium_news = self._scrape_selenium_sources(symbol, known[symbol])
+                    results[symbol] = self._save_news(symbol, investopaper_futures[symbol].result(), selenium_news)
+        finally:
+            self.force_refresh = False
+
+        return results
+
 # Example usage:
 # if __name__ == "__main__":
 #     scraper = NepseNewsScraper()
@@ -1,42 +1,116 @@
 import os
+import re
 import json
+import hashlib
+import orjson
 from ollama import Client
-from typing import List, Dict
+from typing import List, Dict, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from sentiment_cache import SentimentCache
+
+# Bump whenever the prompt changes so results cached for the old prompt are not reused
+PROMPT_VERSION = "v4"
+# Article bodies are cut to roughly 500 tokens (about 4 characters each) before they are sent
+BODY_CHARS = 2000
+# Upper bound on the characters of news packed into one multi-item prompt
+BATCH_CHARS = 12000
+# Fallback for JSON replies that do not parse cleanly, e.g. truncated or with trailing text
+_PAT = re.compile(r'"positive"\s*:\s*"?(\d+)')
+_REMARKS_PAT = re.compile(r'"(positive_remarks|negative_remarks)"\s*:\s*"((?:[^"\\]|\\.)*)')
+# Positive share from a rendered sentiment table
+_TABLE_PAT = re.compile(r'\|\s*Positive\s*\|\s*(\d+)%')
+_NON_WORD = re.compile(r'\W+')
+
+def _normalize(text: str) -> str:
+    return _NON_WORD.sub(' ', text.lower()).strip()
 
 class SentimentAnalyzer:
+    # The instructions go in a fixed system message and only the news varies in the user message,
+    # so Ollama can reuse the evaluated instruction prefix from its KV cache across requests
+    _SYSTEM_PROMPT = """
+    Analyze the sentiment of the financial news text related to a NEPSE stock given by the user.
+    Determine the sentiment distribution (Positive, Negative) and provide specific remarks.
+
+    Rules:
+    1. positive and negative are percentages that must add up to 100
+    2. Remarks should be concise points from the text
+    3. Focus on financial indicators like profit, revenue, expenses, growth, etc.
+    4. If text is neutral, use a 50-50 distribution
+
+    Respond ONLY as JSON: {"positive": <int>, "negative": <int>, "positive_remarks": "...", "negative_remarks": "..."}
+    """
+
+    _BATCH_SYSTEM_PROMPT = """
+    Analyze the sentiment of each of the numbered financial news texts related to NEPSE stocks given by the user.
+    For each text, determine the sentiment distribution (Positive, Negative) and provide specific remarks.
+
+    Return ONLY a JSON object of this exact form, with one entry per text:
+    {"results": [{"idx": 1, "positive": <int>, "negative": <int>, "positive_remarks": "...", "negative_remarks": "..."}, ...]}
+
+    Rules:
+    1. positive and negative are percentages that must add up to 100
+    2. Remarks should be concise points from the text
+    3. Focus on financial indicators like profit, revenue, expenses, growth, etc.
+    4. If a text is neutral, use a 50-50 distribution
+    """
+
     def __init__(self):
         self.client = Client(host='http://localhost:11434')
-        self.model_name = "gemma3:4b"
+        # A 4-bit quantized build by default: generation is memory-bandwidth bound, so smaller
+        # weights give proportionally more tokens per second; override with SENTIMENT_MODEL
+        self.model_name = os.environ.get('SENTIMENT_MODEL', "gemma3:4b-it-q4_K_M")
+        # Keep every core busy on the CPU backend and evaluate prompts in large batches
+        self.options = {'temperature': 0.2, 'num_thread': os.cpu_count(), 'num_batch': 512}
+        # SENTIMENT_BACKEND=finbert scores news with a local int8 FinBERT model instead of the LLM:
+        # orders of magnitude faster, but the remarks only report the class probabilities
+        self.classifier = None
+        if os.environ.get('SENTIMENT_BACKEND', 'ollama').lower() == 'finbert':
+            from finbert_classifier import FinBertClassifier
+            self.classifier = FinBertClassifier()
+            self.model_name = self.classifier.name
         self.data_dir = "data"
+        # Requests kept in flight against Ollama; match the server's OLLAMA_NUM_PARALLEL
+        self.max_parallel = int(os.environ.get('OLLAMA_NUM_PARALLEL', 4))
+        os.makedirs(self.data_dir, exist_ok=True)
+        self.cache = SentimentCache(os.path.join(self.data_dir, 'sentiment_cache.db'))
     
-    def analyze_sentiment(self, text: str) -> Dict:
-        prompt = f"""
-        Analyze the sentiment of the following financial news text related to a NEPSE stock.
-        Determine the sentiment distribution (Positive, Negative) and provide specific remarks.
-
-        Return ONLY in this exact format:
-        | Sentiment       | Percentage | Remarks                                    |
-        |-----------------|------------|--------------------------------------------|
-        | Positive        | XX%        | [Specific positive aspects from the text]  |
-        | Negative        | YY%        | [Specific negative aspects from the text]  |
-
-        Rules:
-        1. The percentages must add up to 100%
-        2. Remarks should be concise bullet points from the text
-        3. Focus on financial indicators like profit, revenue, expenses, growth, etc.
-        4. If text is neutral, use 50%-50% distribution
-
-        Text to analyze:
-        {text}
-        """
+    def _cache_key(self, item: Tuple[str, str]) -> str:
+        title, body = item
+        digest = hashlib.sha256(f"{self.model_name}|{PROMPT_VERSION}|".encode('utf-8'))
+        digest.update(title.encode('utf-8'))
+        digest.update(b'\n')
+        digest.update(body.encode('utf-8'))
+        return digest.hexdigest()
+    
+    def _item_text(self, item: Tuple[str, str]) -> str:
+        # The text the model sees for a (title, body) item, with the body cut to the token budget
+        title, body = item
+        return f"{title}\n{body[:BODY_CHARS]}"
+    
+    def analyze_sentiment(self, item: Tuple[str, str]) -> Dict:
+        # With the FinBERT backend there is no LLM to ask; the batched classifier path handles it
+        if self.classifier is not None:
+            return self.analyze_sentiments([item])[0]
+        
+        # Inference dominates the cost here, so identical items are only ever analyzed once
+        key = self._cache_key(item)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return json.loads(cached)
         
         try:
-            response = self.client.generate(
+            response = self.client.chat(
                 model=self.model_name,
-                prompt=prompt,
-                options={'temperature': 0.2, 'num_ctx': 4096}
+                messages=[
+                    {'role': 'system', 'content': self._SYSTEM_PROMPT},
+                    {'role': 'user', 'content': self._item_text(item)}
+                ],
+                format='json',
+                options={**self.options, 'num_ctx': 4096}
             )
-            return self._parse_response(response['response'])
+            result = self._parse_response(response['message']['content'])
+            self.cache.set(key, json.dumps(result))
+            return result
         except Exception as e:
             print(f"Error in sentiment analysis: {e}")
             return {
@@ -46,16 +120,140 @@ class SentimentAnalyzer:
                                   "| Negative        | 50%        | Neutral content       |"
             }
     
-    def _parse_response(self, response_text: str) -> Dict:
-        # Extract the table part from the response
-        table_start = response_text.find("| Sentiment")
-        table_end = response_text.find("\n\n", table_start)
-        table = response_text[table_start:table_end].strip() if table_start != -1 else response_text
+    def analyze_sentiments(self, items: List[Tuple[str, str]], chunk_size: int = 8) -> List[Dict]:
+        # Batched entry point for analysis of (title, body) items; results are returned in input order.
+        # Items are sent several to a prompt so the instructions are only paid for once per chunk,
+        # and chunks are sent concurrently, at most `max_parallel` at a time.
+        results = [None] * len(items)
+        # Uncached items, each mapped to every position it occurs at so repeats are analyzed once
+        pending = {}
+        for i, item in enumerate(items):
+            cached = self.cache.get(self._cache_key(item))
+            if cached is not None:
+                results[i] = json.loads(cached)
+            else:
+                pending.setdefault(item, []).append(i)
+        
+        if self.classifier is not None:
+            # The classifier takes every pending item in batched forward passes
+            unique_items = list(pending)
+            texts = [self._item_text(item) for item in unique_items]
+            for item, probabilities in zip(unique_items, self.classifier.classify(texts)):
+                analysis = self._result_from_probabilities(probabilities)
+                self.cache.set(self._cache_key(item), json.dumps(analysis))
+                for i in pending[item]:
+                    results[i] = analysis
+        else:
+            # Chunks are capped by item count and by size so the prompt stays well inside num_ctx
+            chunks, chunk, chunk_chars = [], [], 0
+            for item in pending:
+                item_chars = len(item[0]) + min(len(item[1]), BODY_CHARS)
+                if chunk and (len(chunk) >= chunk_size or chunk_chars + item_chars > BATCH_CHARS):
+                    chunks.append(chunk)
+                    chunk, chunk_chars = [], 0
+                chunk.append(item)
+                chunk_chars += item_chars
+            if chunk:
+                chunks.append(chunk)
+            
+            with ThreadPoolExecutor(max_workers=self.max_parallel) as executor:
+                for chunk, analyses in zip(chunks, executor.map(self._analyze_chunk, chunks)):
+                    for item, analysis in zip(chunk, analyses):
+                        for i in pending[item]:
+                            results[i] = analysis
+        self.cache.commit()
+        return results
+    
+    def _analyze_chunk(self, items: List[Tuple[str, str]]) -> List[Dict]:
+        # A single item gains nothing from the multi-item prompt
+        if len(items) == 1:
+            return [self.analyze_sentiment(items[0])]
+        
+        numbered = "\n\n".join(f"[{n}] {self._item_text(item)}" for n, item in enumerate(items, 1))
         
+        parsed = {}
+        try:
+            response = self.client.chat(
+                model=self.model_name,
+                messages=[
+                    {'role': 'system', 'content': self._BATCH_SYSTEM_PROMPT},
+                    {'role': 'user', 'content': numbered}
+                ],
+                format='json',
+                options={**self.options, 'num_ctx': 8192}
+            )
+            for entry in json.loads(response['message']['content']).get('results', []):
+                try:
+                    parsed[int(entry['idx'])] = self._result_from_json(entry)
+                except (KeyError, TypeError, ValueError):
+                    continue
+        except Exception as e:
+            print(f"Error in batch sentiment analysis: {e}")
+        
+        results = []
+        for n, item in enumerate(items, 1):
+            if n in parsed:
+                self.cache.set(self._cache_key(item), json.dumps(parsed[n]))
+                results.append(parsed[n])
+            else:
+                # Items the model dropped or mangled are retried on their own
+                results.append(self.analyze_sentiment(item))
+        return results
+    
+    def _result_from_probabilities(self, probabilities: Dict) -> Dict:
+        # Neutral probability is split evenly, in line with the 50-50 distribution for neutral news
+        positive = round(100 * (probabilities['positive'] + probabilities['neutral'] / 2))
+        return {
+            'sentiment_table': self._format_table(
+                positive, 100 - positive,
+                f"Positive probability {probabilities['positive']:.0%}",
+                f"Negative probability {probabilities['negative']:.0%}, neutral {probabilities['neutral']:.0%}"
+            )
+        }
+    
+    def _format_table(self, positive: int, negative: int, positive_remarks: str, negative_remarks: str) -> str:
+        # Renders a batch result in the same table layout the single-item prompt asks for
+        positive_remarks, negative_remarks = (
+            ("; ".join(map(str, r)) if isinstance(r, list) else str(r)).replace("|", "/").replace("\n", " ")
+            for r in (positive_remarks, negative_remarks)
+        )
+        return ("| Sentiment       | Percentage | Remarks                                    |\n" +
+                "|-----------------|------------|--------------------------------------------|\n" +
+                f"| Positive        | {positive}%        | {positive_remarks} |\n" +
+                f"| Negative        | {negative}%        | {negative_remarks} |")
+    
+    def _parse_response(self, response_text: str) -> Dict:
+        try:
+            return self._result_from_json(json.loads(response_text))
+        except (ValueError, TypeError, KeyError):
+            match = _PAT.search(response_text)
+            if not match:
+                raise ValueError(f"Unparseable sentiment response: {response_text[:200]!r}")
+            data = dict(_REMARKS_PAT.findall(response_text))
+            data['positive'] = match.group(1)
+            return self._result_from_json(data)
+    
+    def _result_from_json(self, data: Dict) -> Dict:
+        # The negative share is always rendered as the complement so the table adds up to 100
+        positive = min(max(int(data['positive']), 0), 100)
         return {
-            'sentiment_table': table
+            'sentiment_table': self._format_table(
+                positive, 100 - positive,
+                data.get('positive_remarks', ''), data.get('negative_remarks', '')
+            )
         }
     
+    def _find_duplicates(self, items: List[Tuple[str, str]]) -> List[int]:
+        # Maps each item to the index of the first item it duplicates (itself if it is new), by a
+        # digest of the normalized title and body. There is deliberately no fuzzy matching: NEPSE
+        # notices are templated, so reports that differ only in company or figures look alike
+        owners = []
+        seen = {}
+        for i, (title, body) in enumerate(items):
+            digest = hashlib.sha1(f"{_normalize(title)}\n{_normalize(body)}".encode('utf-8')).digest()
+            owners.append(seen.setdefault(digest, i))
+        return owners
+    
     def analyze_news_for_symbol(self, symbol: str) -> List[Dict]:
         filename = os.path.join(self.data_dir, f"{symbol.lower()}_news.json")
         
@@ -63,19 +261,29 @@ class SentimentAnalyzer:
             print(f"No news data found for {symbol}")
             return []
         
-        with open(filename, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with open(filename, 'rb') as f:
+            data = orjson.loads(f.read())
         
-        analyzed_news = []
-        for news_item in data['news']:
-            analysis = self.analyze_sentiment(news_item['title'] + "\n" + news_item['full_content'])
-            analyzed_news.append({
+        news = data['news']
+        # Failed scrapes can leave a title or body missing; analyze those as empty text
+        items = [(news_item.get('title') or '', news_item.get('full_content') or '') for news_item in news]
+        # Sources often carry the same story; only one copy is analyzed and its result is
+        # attached to every duplicate, so the report still counts each item
+        owners = self._find_duplicates(items)
+        unique = sorted(set(owners))
+        if len(unique) < len(items):
+            print(f"Skipping analysis of {len(items) - len(unique)} duplicate news items for {symbol}")
+        unique_analyses = dict(zip(unique, self.analyze_sentiments([items[i] for i in unique])))
+        
+        analyzed_news = [None] * len(news)
+        for i, news_item in enumerate(news):
+            analyzed_news[i] = {
                 'title': news_item['title'],
                 'link': news_item['link'],
                 'date': news_item['date'],
-                'sentiment_analysis': analysis['sentiment_table'],
+                'sentiment_analysis': unique_analyses[owners[i]]['sentiment_table'],
                 'source': news_item['source']
-            })
+            }
         
         return analyzed_news
     
@@ -83,31 +291,16 @@ class SentimentAnalyzer:
         if not analyzed_news:
             return f"No news analyzed for {symbol}"
         
-        # Calculate overall sentiment percentages
+        # Calculate overall sentiment percentages. Only the positive share needs parsing:
+        # the negative share reported is always its complement.
         positive_sum = 0
-        negative_sum = 0
         count = 0
         
         for item in analyzed_news:
-            lines = item['sentiment_analysis'].split('\n')
-            if len(lines) >= 3:
-                positive_line = lines[2].split('|')
-                if len(positive_line) > 3:
-                    positive_pct = positive_line[2].strip().replace('%','')
-                    try:
-                        positive_sum += float(positive_pct)
-                        count += 1
-                    except ValueError:
-                        pass
-                
-                if len(lines) >= 4:
-                    negative_line = lines[3].split('|')
-                    if len(negative_line) > 3:
-                        negative_pct = negative_line[2].strip().replace('%','')
-                        try:
-                            negative_sum += float(negative_pct)
-                        except ValueError:
-                            pass
+            match = _TABLE_PAT.search(item['sentiment_analysis'])
+            if match:
+                positive_sum += int(match.group(1))
+                count += 1
         
         avg_positive = round(positive_sum / count) if count > 0 else 50
         avg_negative = 100 - avg_positive
@@ -0,0 +1,37 @@
+import sqlite3
+import threading
+
+class SentimentCache:
+    """
+    Small SQLite store for parsed sentiment results, keyed by a hash of the model, prompt version
+    and analyzed text. Lets re-runs skip inference for news that was already analyzed.
+    """
+    def __init__(self, db_path):
+        # The analyzer reads and writes from its worker threads, so one connection is shared behind a lock
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute("CREATE TABLE IF NOT EXISTS sentiments(hash TEXT PRIMARY KEY, result TEXT)")
+
+    def get(self, key):
+        """
+        Returns the cached result (a JSON string) for `key`, or None if it is missing.
+        """
+        with self._lock:
+            row = self.conn.execute("SELECT result FROM sentiments WHERE hash=?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def set(self, key, result):
+        """
+        Stores the result (a JSON string) for `key`. Writes are only persisted on `commit()`.
+        """
+        with self._lock:
+            self.conn.execute("INSERT OR REPLACE INTO sentiments(hash, result) VALUES (?, ?)", (key, result))
+
+    def commit(self):
+        with self._lock:
+            self.conn.commit()
+
+    def close(self):
+        with self._lock:
+            self.conn.commit()
+            self.conn.close()
@@ -0,0 +1,36 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sentiment_analyzer import SentimentAnalyzer
+
+
+class FindDuplicatesTest(unittest.TestCase):
+    def setUp(self):
+        # _find_duplicates needs no Ollama client or cache, so skip __init__
+        self.analyzer = SentimentAnalyzer.__new__(SentimentAnalyzer)
+
+    def test_templated_reports_differing_only_in_numbers_stay_separate(self):
+        body = ("The board of directors of {company} Bank Limited has proposed a {pct}% dividend "
+                "for the fiscal year 2080/81, comprising {bonus}% bonus shares and {cash}% cash "
+                "dividend for tax purposes, subject to approval by the annual general meeting.")
+        items = [
+            ("XYZ Bank declares 10% dividend", body.format(company="XYZ", pct=10, bonus=5, cash=5)),
+            ("ABC Bank declares 12% dividend", body.format(company="ABC", pct=12, bonus=6, cash=6)),
+            ("XYZ Bank declares 12% dividend", body.format(company="XYZ", pct=12, bonus=6, cash=6)),
+        ]
+        self.assertEqual(self.analyzer._find_duplicates(items), [0, 1, 2])
+
+    def test_copies_differing_only_in_case_and_punctuation_are_merged(self):
+        items = [
+            ("NABIL Q1 profit up", "Net profit rose 12 percent."),
+            ("Nabil: Q1 profit up!", "net profit rose 12 percent"),
+            ("NABIL Q2 profit up", "Net profit rose 15 percent."),
+        ]
+        self.assertEqual(self.analyzer._find_duplicates(items), [0, 0, 2])
+
+
+if __name__ == '__main__':
+    unittest.main()